@@ -2,7 +2,387 @@ import json
 import os
 import random
 import argparse
-from typing import List, Dict, Any, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from itertools import islice
+from typing import List, Dict, Any, Callable, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson est facultatif: repli sur le module json standard
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+    # Un seul encodeur pour tout le fichier: json.dumps en recrée un à chaque
+    # appel dès qu'une option autre que celles par défaut est passée. Sortie
+    # compacte, comme celle d'orjson
+    _json_encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+    def _json_dumps(obj: Any) -> bytes:
+        return _json_encode(obj).encode('utf-8')
+
+# Dictionnaire de base français -> espagnol
+FR_TO_ES = {
+    # Mots courants
+    "bonjour": "hola",
+    "salut": "hola",
+    "merci": "gracias",
+    "au revoir": "adiós",
+    "comment": "cómo",
+    "combien": "cuánto",
+    "coûte": "cuesta",
+    "prix": "precio",
+    "documents": "documentos",
+    "requis": "requeridos",
+    "nécessaires": "necesarios",
+    "procédure": "procedimiento",
+    "obtenir": "obtener",
+    "ministère": "ministerio",
+    "responsable": "responsable",
+    "taxe": "tasa",
+    "taxes": "tasas",
+    "fiscales": "fiscales",
+    "s'il vous plaît": "por favor",
+    "information": "información",
+    "je voudrais": "quisiera",
+    "besoin": "necesito",
+    "savoir": "saber",
+    "cherche": "busco",
+    "quels": "cuáles",
+    "quelles": "cuáles",
+    "est": "es",
+    "sont": "son",
+    "pour": "para",
+    "de": "de",
+    "du": "del",
+    "la": "la",
+    "le": "el",
+    "les": "los",
+    "un": "un",
+    "une": "una",
+    "des": "de los",
+    "et": "y",
+    "ou": "o",
+    "qui": "qué",
+    "quel": "cuál",
+    "quelle": "cuál",
+
+    # Termes spécifiques aux taxes
+    "passeport": "pasaporte",
+    "visa": "visado",
+    "carte d'identité": "documento de identidad",
+    "permis": "permiso",
+    "expédition": "expedición",
+    "renouvellement": "renovación",
+    "montant": "cantidad",
+    "paiement": "pago",
+    "payer": "pagar",
+}
+
+# Dictionnaire de base français -> anglais
+FR_TO_EN = {
+    # Mots courants
+    "bonjour": "hello",
+    "salut": "hi",
+    "merci": "thank you",
+    "au revoir": "goodbye",
+    "comment": "how",
+    "combien": "how much",
+    "coûte": "cost",
+    "prix": "price",
+    "documents": "documents",
+    "requis": "required",
+    "nécessaires": "necessary",
+    "procédure": "procedure",
+    "obtenir": "obtain",
+    "ministère": "ministry",
+    "responsable": "responsible",
+    "taxe": "tax",
+    "taxes": "taxes",
+    "fiscales": "fiscal",
+    "s'il vous plaît": "please",
+    "information": "information",
+    "je voudrais": "I would like",
+    "besoin": "need",
+    "savoir": "know",
+    "cherche": "looking for",
+    "quels": "which",
+    "quelles": "which",
+    "est": "is",
+    "sont": "are",
+    "pour": "for",
+    "de": "of",
+    "du": "of the",
+    "la": "the",
+    "le": "the",
+    "les": "the",
+    "un": "a",
+    "une": "a",
+    "des": "of the",
+    "et": "and",
+    "ou": "or",
+    "qui": "who",
+    "quel": "which",
+    "quelle": "which",
+
+    # Termes spécifiques aux taxes
+    "passeport": "passport",
+    "visa": "visa",
+    "carte d'identité": "identity card",
+    "permis": "permit",
+    "expédition": "issuance",
+    "renouvellement": "renewal",
+    "montant": "amount",
+    "paiement": "payment",
+    "payer": "pay",
+}
+
+def _translate(text: str, dictionary: Dict[str, str]) -> str:
+    """
+    Remplace mot à mot les termes français connus de `dictionary`, en
+    conservant la ponctuation finale, puis met la première lettre en majuscule.
+    """
+    translated_words = []
+    
+    for word in text.lower().split():
+        # Nettoyage pour la comparaison
+        clean_word = word.strip(".,;:!?")
+        
+        # Chercher la traduction en une seule recherche, en conservant la ponctuation si présente
+        translation = dictionary.get(clean_word)
+        if translation is None:
+            translated_words.append(word)
+        else:
+            translated_words.append(translation + word[len(clean_word):])
+    
+    # Reconstruction avec la première lettre en majuscule (le découpage gère aussi le texte vide)
+    translated_text = " ".join(translated_words)
+    return translated_text[:1].upper() + translated_text[1:]
+
+def _iter_conceptos(data: List[Dict[str, Any]]) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Parcourt la hiérarchie ministère > secteur > catégorie > sous-catégorie et
+    produit chaque concepto avec les champs hérités de sa sous-catégorie.
+    Ces champs sont construits une seule fois par sous-catégorie et partagés
+    entre ses conceptos. Un niveau absent ou nul est parcouru comme le tuple
+    vide partagé, sans allouer de liste.
+    """
+    for ministerio in data:
+        ministerio_id = ministerio.get('id')
+        ministerio_nombre = ministerio.get('nombre')
+        
+        for sector in ministerio.get('sectores') or ():
+            sector_id = sector.get('id')
+            sector_nombre = sector.get('nombre')
+            
+            for categoria in sector.get('categorias') or ():
+                categoria_id = categoria.get('id')
+                categoria_nombre = categoria.get('nombre')
+                
+                for sub_categoria in categoria.get('sub_categorias') or ():
+                    parent_fields = {
+                        'ministerio_id': ministerio_id,
+                        'ministerio_nombre': ministerio_nombre,
+                        'sector_id': sector_id,
+                        'sector_nombre': sector_nombre,
+                        'categoria_id': categoria_id,
+                        'categoria_nombre': categoria_nombre,
+                        'sub_categoria_id': sub_categoria.get('id'),
+                        'sub_categoria_nombre': sub_categoria.get('nombre')
+                    }
+                    for concepto in sub_categoria.get('conceptos') or ():
+                        yield parent_fields, concepto
+
+def _cost_answer(tax_name: str, tasa_expedicion: str, tasa_renovacion: str) -> str:
+    """
+    Construit la réponse sur le coût d'une taxe, commune aux questions
+    spécifiques et aux questions synthétiques.
+    """
+    cost_answer = f"Pour {tax_name}, "
+    has_expedicion = tasa_expedicion and tasa_expedicion != '0'
+    has_renovacion = tasa_renovacion and tasa_renovacion != '0'
+    
+    if has_expedicion and has_renovacion:
+        cost_answer += f"le coût d'expédition est de {tasa_expedicion} FCFA et le coût de renouvellement est de {tasa_renovacion} FCFA."
+    elif has_expedicion:
+        cost_answer += f"le coût est de {tasa_expedicion} FCFA."
+    elif has_renovacion:
+        cost_answer += f"le coût de renouvellement est de {tasa_renovacion} FCFA."
+    else:
+        cost_answer += "les informations de coût ne sont pas disponibles."
+    
+    return cost_answer
+
+class QAPair(NamedTuple):
+    """Paire question-réponse produite par les générateurs, avant traduction."""
+    question: str
+    answer: str
+
+def _pairs_to_dicts(pairs: Iterable[QAPair]) -> List[Dict[str, str]]:
+    """
+    Convertit des QAPair en dictionnaires {"question", "answer"}, la forme
+    renvoyée par les méthodes publiques generate_*.
+    """
+    return [{"question": question, "answer": answer} for question, answer in pairs]
+
+# Nombre de paires encodées puis écrites ensemble lors de la sauvegarde du corpus
+WRITE_BATCH_SIZE = 10000
+
+def _compile_templates(field: str, templates: Iterable[str]) -> Tuple[Callable[[str], str], ...]:
+    """
+    Prépare des modèles à un seul champ `{field}` sous forme de fonctions qui
+    concatènent directement les deux segments littéraux: contrairement à
+    str.format, le modèle n'est pas réanalysé à chaque appel.
+    """
+    placeholder = "{" + field + "}"
+    formatters = []
+    for template in templates:
+        head, tail = template.split(placeholder)
+        formatters.append(lambda value, head=head, tail=tail: f"{head}{value}{tail}")
+    return tuple(formatters)
+
+# Modèles de questions, préparés une fois à l'import pour éviter de
+# reconstruire les listes et de réanalyser les modèles à chaque taxe
+
+# Questions sur un ministère
+MINISTERIO_QUESTIONS = _compile_templates("ministerio_nombre", (
+    "Quelles sont les taxes du {ministerio_nombre}?",
+    "Quels services sont fournis par le {ministerio_nombre}?",
+    "Quels types de taxes sont gérés par le {ministerio_nombre}?",
+    "Parle-moi des taxes du {ministerio_nombre}",
+    "Quelles sont les responsabilités fiscales du {ministerio_nombre}?",
+))
+
+# Questions sur le nombre total de taxes
+GENERAL_QUESTIONS = (
+    "Combien de taxes existent au total?",
+    "Quel est le nombre total de taxes fiscales?",
+    "Combien de types de taxes y a-t-il dans le système?",
+    "Peux-tu me dire le nombre total de taxes disponibles?",
+)
+
+# Questions sur le coût
+COST_QUESTIONS = _compile_templates("tax_name", (
+    "Combien coûte {tax_name}?",
+    "Quel est le prix de {tax_name}?",
+    "Quel est le montant à payer pour {tax_name}?",
+    "Combien dois-je payer pour {tax_name}?",
+    "Quel est le tarif pour {tax_name}?",
+))
+
+# Questions sur les documents requis
+DOC_QUESTIONS = _compile_templates("tax_name", (
+    "Quels documents sont nécessaires pour {tax_name}?",
+    "Quels documents dois-je fournir pour {tax_name}?",
+    "Quels papiers faut-il pour {tax_name}?",
+    "Quels sont les documents requis pour {tax_name}?",
+    "Documentation nécessaire pour {tax_name}?",
+))
+
+# Questions sur la procédure
+PROC_QUESTIONS = _compile_templates("tax_name", (
+    "Quelle est la procédure pour {tax_name}?",
+    "Comment obtenir {tax_name}?",
+    "Quelles sont les étapes pour {tax_name}?",
+    "Expliquez-moi la procédure pour {tax_name}",
+    "Comment faire pour obtenir {tax_name}?",
+))
+
+# Questions sur le ministère responsable
+MINISTRY_QUESTIONS = _compile_templates("tax_name", (
+    "Quel ministère est responsable de {tax_name}?",
+    "Qui gère {tax_name}?",
+    "Quel organisme s'occupe de {tax_name}?",
+    "De quel ministère dépend {tax_name}?",
+    "À quel ministère appartient {tax_name}?",
+))
+
+# Questions de recherche par mot-clé
+SEARCH_QUESTIONS = _compile_templates("keyword", (
+    "Quelles taxes concernent {keyword}?",
+    "Y a-t-il des taxes liées à {keyword}?",
+    "Parlez-moi des taxes sur {keyword}",
+    "Quels sont les frais liés à {keyword}?",
+    "Je cherche des informations sur les taxes de {keyword}",
+))
+
+# Questions informelles ou mal orthographiées
+INFORMAL_QUESTIONS = _compile_templates("tax_name", (
+    "c koi le prix de {tax_name}?",
+    "combien ça coute {tax_name}",
+    "je veu savoir le prix de {tax_name}",
+    "tarif {tax_name} svp",
+    "info sur {tax_name}",
+))
+
+# Préfixes et suffixes ajoutés aléatoirement aux questions augmentées
+AUGMENTATION_PREFIXES = ("Dites-moi ", "Je voudrais savoir ", "Pourriez-vous me dire ", "J'aimerais connaître ")
+AUGMENTATION_SUFFIXES = (" s'il vous plaît", " merci", " si possible", " rapidement")
+
+# Questions générales vagues ou ambiguës, avec la demande de précision associée
+VAGUE_QUESTIONS = (
+    QAPair(
+        question="Comment obtenir un passeport?",
+        answer="Pour obtenir un passeport, vous devez vérifier les frais spécifiques et les documents requis. Pouvez-vous préciser quel type de passeport vous intéresse?"
+    ),
+    QAPair(
+        question="Combien coûte une carte d'identité?",
+        answer="Le coût d'une carte d'identité dépend du type et du ministère concerné. Pouvez-vous préciser quelle carte d'identité vous intéresse?"
+    ),
+    QAPair(
+        question="Documents pour visa",
+        answer="Les documents requis pour un visa dépendent du type de visa. Pouvez-vous préciser quel visa vous intéresse?"
+    ),
+    QAPair(
+        question="Prix du permis",
+        answer="Le prix du permis varie selon le type. Pouvez-vous préciser quel permis vous intéresse?"
+    ),
+    QAPair(
+        question="Où payer les taxes?",
+        answer="Les taxes peuvent être payées auprès du ministère concerné. Pour des informations plus précises, veuillez spécifier quelle taxe vous intéresse."
+    ),
+)
+
+# Questions d'ouverture de conversation et de suivi, identiques à chaque génération
+CONVERSATION_STARTERS = (
+    QAPair(
+        question="Bonjour",
+        answer="Bonjour! Je suis l'assistant virtuel de TaxasGE. Je peux vous aider à trouver des informations sur les taxes fiscales en Guinée Équatoriale. Que souhaitez-vous savoir?"
+    ),
+    QAPair(
+        question="Salut",
+        answer="Salut! Je suis là pour vous aider avec les informations sur les taxes fiscales. Comment puis-je vous aider aujourd'hui?"
+    ),
+    QAPair(
+        question="Comment ça va?",
+        answer="Je vais bien, merci! Je suis prêt à vous aider avec les informations sur les taxes et services fiscaux. Quelle information recherchez-vous?"
+    ),
+    QAPair(
+        question="Qui es-tu?",
+        answer="Je suis l'assistant virtuel de TaxasGE, conçu pour vous aider à trouver des informations sur les taxes fiscales en Guinée Équatoriale. Je peux vous renseigner sur les coûts, les documents requis et les procédures pour différentes taxes."
+    ),
+    QAPair(
+        question="Comment t'utiliser?",
+        answer="C'est simple! Vous pouvez me poser des questions sur les taxes fiscales, comme 'Combien coûte un passeport?' ou 'Quels documents sont nécessaires pour un visa?'. Je ferai de mon mieux pour vous répondre avec les informations dont je dispose."
+    ),
+    QAPair(
+        question="Que peux-tu faire?",
+        answer="Je peux vous fournir des informations sur les taxes fiscales en Guinée Équatoriale, notamment les coûts, les documents requis, les procédures, et les ministères responsables. N'hésitez pas à me poser des questions spécifiques sur la taxe qui vous intéresse."
+    ),
+    QAPair(
+        question="Merci",
+        answer="Je vous en prie! N'hésitez pas à me poser d'autres questions si vous avez besoin de plus d'informations. Je suis là pour vous aider."
+    ),
+    QAPair(
+        question="Au revoir",
+        answer="Au revoir! N'hésitez pas à revenir si vous avez d'autres questions sur les taxes fiscales. Bonne journée!"
+    ),
+)
 
 class CorpusGenerator:
     """
@@ -13,124 +393,112 @@ class CorpusGenerator:
     questions des utilisateurs concernant les taxes.
     """
     
-    def __init__(self, input_file: str):
+    def __init__(self, input_file: str, seed: Optional[int] = None):
         """
         Initialise le générateur de corpus.
         
         Args:
             input_file: Chemin vers le fichier JSON contenant les données fiscales
+            seed: Graine du générateur aléatoire, pour un corpus reproductible
         """
         self.input_file = input_file
-        self.data = self._load_data()
-        self.tax_data = self._flatten_data()
+        # Générateur aléatoire propre à l'instance: indépendant de l'état global
+        # du module random, et donc reproductible à graine égale
+        self.rng = random.Random(seed)
+        # L'arbre brut n'est pas conservé: seule la version aplatie est utilisée
+        self.tax_data = self._flatten_data(self._load_data())
         
     def _load_data(self) -> List[Dict[str, Any]]:
         """Charge les données fiscales depuis le fichier JSON."""
         try:
-            with open(self.input_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.input_file, 'rb') as f:
+                return _json_loads(f.read())
         except Exception as e:
             print(f"Erreur lors du chargement des données: {e}")
             return []
     
-    def _flatten_data(self) -> List[Dict[str, Any]]:
+    def _flatten_data(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Aplatit la structure hiérarchique des données fiscales pour faciliter
         la génération des questions-réponses.
+        
+        Args:
+            data: Liste des ministères telle que chargée depuis le fichier JSON
         """
         flattened_data = []
         
-        for ministerio in self.data:
-            ministerio_id = ministerio.get('id')
-            ministerio_nombre = ministerio.get('nombre')
-            
-            for sector in ministerio.get('sectores', []):
-                sector_id = sector.get('id')
-                sector_nombre = sector.get('nombre')
-                
-                for categoria in sector.get('categorias', []):
-                    categoria_id = categoria.get('id')
-                    categoria_nombre = categoria.get('nombre')
-                    
-                    for sub_categoria in categoria.get('sub_categorias', []):
-                        sub_categoria_id = sub_categoria.get('id')
-                        sub_categoria_nombre = sub_categoria.get('nombre')
-                        
-                        for concepto in sub_categoria.get('conceptos', []):
-                            tax_entry = {
-                                'concepto_id': concepto.get('id'),
-                                'concepto_nombre': concepto.get('nombre'),
-                                'tasa_expedicion': concepto.get('tasa_expedicion', ''),
-                                'tasa_renovacion': concepto.get('tasa_renovacion', ''),
-                                'documentos_requeridos': concepto.get('documentos_requeridos', ''),
-                                'procedimiento': concepto.get('procedimiento', ''),
-                                'palabras_clave': concepto.get('palabras_clave', ''),
-                                'ministerio_id': ministerio_id,
-                                'ministerio_nombre': ministerio_nombre,
-                                'sector_id': sector_id,
-                                'sector_nombre': sector_nombre,
-                                'categoria_id': categoria_id,
-                                'categoria_nombre': categoria_nombre,
-                                'sub_categoria_id': sub_categoria_id,
-                                'sub_categoria_nombre': sub_categoria_nombre
-                            }
-                            flattened_data.append(tax_entry)
+        for parent_fields, concepto in _iter_conceptos(data):
+            # Les champs hérités servent de prototype: une copie de dictionnaire
+            # coûte moins cher que la reconstruction d'un littéral complet
+            tax = parent_fields.copy()
+            tax['concepto_id'] = concepto.get('id')
+            tax['concepto_nombre'] = concepto.get('nombre')
+            tax['tasa_expedicion'] = concepto.get('tasa_expedicion', '')
+            tax['tasa_renovacion'] = concepto.get('tasa_renovacion', '')
+            tax['documentos_requeridos'] = concepto.get('documentos_requeridos', '')
+            tax['procedimiento'] = concepto.get('procedimiento', '')
+            tax['palabras_clave'] = concepto.get('palabras_clave', '')
+            flattened_data.append(tax)
         
         return flattened_data
     
+    @staticmethod
+    def _format_tax_list(taxes: List[Dict[str, Any]], others_label: str, limit: int = 5) -> str:
+        """
+        Énumère les noms des premières taxes, suivis du nombre de taxes restantes.
+        
+        Args:
+            taxes: Taxes à énumérer
+            others_label: Libellé des taxes non citées (ex: "autres taxes")
+            limit: Nombre maximal de taxes citées
+        """
+        tax_list = ", ".join([str(tax['concepto_nombre']) for tax in taxes[:limit]])
+        if len(taxes) > limit:
+            return f"{tax_list} et {len(taxes) - limit} {others_label}"
+        return tax_list
+    
     def generate_general_questions(self) -> List[Dict[str, str]]:
         """
         Génère des questions générales sur les taxes et les ministères.
         """
+        return _pairs_to_dicts(self._general_question_pairs())
+    
+    def _general_question_pairs(self) -> List[QAPair]:
+        """Paires de generate_general_questions, sous forme de QAPair."""
         qa_pairs = []
+        add_qa = qa_pairs.append
         
-        # Questions sur les ministères
-        ministerios = set()
+        # Questions sur les ministères (dédoublonnés dans l'ordre des données),
+        # avec les taxes regroupées par ministère en un seul parcours
+        ministerios = {}
+        taxes_by_ministerio = {}
         for item in self.tax_data:
-            ministerios.add((item['ministerio_id'], item['ministerio_nombre']))
+            ministerios[(item['ministerio_id'], item['ministerio_nombre'])] = None
+            taxes_by_ministerio.setdefault(item['ministerio_id'], []).append(item)
         
         for ministerio_id, ministerio_nombre in ministerios:
-            # Questions sur le ministère
-            questions = [
-                f"Quelles sont les taxes du {ministerio_nombre}?",
-                f"Quels services sont fournis par le {ministerio_nombre}?",
-                f"Quels types de taxes sont gérés par le {ministerio_nombre}?",
-                f"Parle-moi des taxes du {ministerio_nombre}",
-                f"Quelles sont les responsabilités fiscales du {ministerio_nombre}?"
-            ]
-            
             # Construire la réponse
-            taxes_ministerio = [item for item in self.tax_data if item['ministerio_id'] == ministerio_id]
-            if taxes_ministerio:
-                taxes_list = ", ".join([f"{tax['concepto_nombre']}" for tax in taxes_ministerio[:5]])
-                if len(taxes_ministerio) > 5:
-                    taxes_list += f" et {len(taxes_ministerio) - 5} autres taxes"
-                
-                answer = f"Le {ministerio_nombre} gère plusieurs taxes et services, notamment: {taxes_list}. "
-                answer += f"Ces taxes concernent {len(taxes_ministerio)} concepts différents dans le domaine."
-                
-                for question in questions:
-                    qa_pairs.append({
-                        "question": question,
-                        "answer": answer
-                    })
+            taxes_ministerio = taxes_by_ministerio[ministerio_id]
+            taxes_list = self._format_tax_list(taxes_ministerio, "autres taxes")
+            
+            answer = f"Le {ministerio_nombre} gère plusieurs taxes et services, notamment: {taxes_list}. "
+            answer += f"Ces taxes concernent {len(taxes_ministerio)} concepts différents dans le domaine."
+            
+            for format_question in MINISTERIO_QUESTIONS:
+                add_qa(QAPair(
+                    question=format_question(ministerio_nombre),
+                    answer=answer
+                ))
         
         # Questions générales sur toutes les taxes
         total_taxes = len(self.tax_data)
-        general_questions = [
-            "Combien de taxes existent au total?",
-            "Quel est le nombre total de taxes fiscales?",
-            "Combien de types de taxes y a-t-il dans le système?",
-            "Peux-tu me dire le nombre total de taxes disponibles?"
-        ]
-        
         general_answer = f"Il existe actuellement {total_taxes} taxes différentes dans le système fiscal. Ces taxes sont réparties entre différents ministères et catégories."
         
-        for question in general_questions:
-            qa_pairs.append({
-                "question": question,
-                "answer": general_answer
-            })
+        for question in GENERAL_QUESTIONS:
+            add_qa(QAPair(
+                question=question,
+                answer=general_answer
+            ))
         
         return qa_pairs
     
@@ -138,96 +506,58 @@ class CorpusGenerator:
         """
         Génère des questions spécifiques pour chaque taxe.
         """
+        return _pairs_to_dicts(self._specific_tax_question_pairs())
+    
+    def _specific_tax_question_pairs(self) -> List[QAPair]:
+        """Paires de generate_specific_tax_questions, sous forme de QAPair."""
         qa_pairs = []
+        # Méthode liée localement: elle est appelée pour chaque question de chaque taxe
+        add_qa = qa_pairs.append
         
         for tax in self.tax_data:
             tax_name = tax['concepto_nombre']
             
-            # Questions sur le coût
-            cost_questions = [
-                f"Combien coûte {tax_name}?",
-                f"Quel est le prix de {tax_name}?",
-                f"Quel est le montant à payer pour {tax_name}?",
-                f"Combien dois-je payer pour {tax_name}?",
-                f"Quel est le tarif pour {tax_name}?"
-            ]
-            
             # Construire la réponse sur le coût
-            cost_answer = f"Pour {tax_name}, "
-            has_expedicion = tax['tasa_expedicion'] and tax['tasa_expedicion'] != '0'
-            has_renovacion = tax['tasa_renovacion'] and tax['tasa_renovacion'] != '0'
-            
-            if has_expedicion and has_renovacion:
-                cost_answer += f"le coût d'expédition est de {tax['tasa_expedicion']} FCFA et le coût de renouvellement est de {tax['tasa_renovacion']} FCFA."
-            elif has_expedicion:
-                cost_answer += f"le coût est de {tax['tasa_expedicion']} FCFA."
-            elif has_renovacion:
-                cost_answer += f"le coût de renouvellement est de {tax['tasa_renovacion']} FCFA."
-            else:
-                cost_answer += "les informations de coût ne sont pas disponibles."
+            cost_answer = _cost_answer(tax_name, tax['tasa_expedicion'], tax['tasa_renovacion'])
             
-            for question in cost_questions:
-                qa_pairs.append({
-                    "question": question,
-                    "answer": cost_answer
-                })
+            for format_question in COST_QUESTIONS:
+                add_qa(QAPair(
+                    question=format_question(tax_name),
+                    answer=cost_answer
+                ))
             
             # Questions sur les documents requis
             if tax['documentos_requeridos']:
-                doc_questions = [
-                    f"Quels documents sont nécessaires pour {tax_name}?",
-                    f"Quels documents dois-je fournir pour {tax_name}?",
-                    f"Quels papiers faut-il pour {tax_name}?",
-                    f"Quels sont les documents requis pour {tax_name}?",
-                    f"Documentation nécessaire pour {tax_name}?"
-                ]
-                
                 # Mettre en forme les documents requis
                 docs = tax['documentos_requeridos'].split('\n')
                 docs_list = ", ".join([doc.strip() for doc in docs if doc.strip()])
                 
                 doc_answer = f"Pour {tax_name}, vous devez fournir les documents suivants: {docs_list}."
                 
-                for question in doc_questions:
-                    qa_pairs.append({
-                        "question": question,
-                        "answer": doc_answer
-                    })
+                for format_question in DOC_QUESTIONS:
+                    add_qa(QAPair(
+                        question=format_question(tax_name),
+                        answer=doc_answer
+                    ))
             
             # Questions sur la procédure
             if tax['procedimiento']:
-                proc_questions = [
-                    f"Quelle est la procédure pour {tax_name}?",
-                    f"Comment obtenir {tax_name}?",
-                    f"Quelles sont les étapes pour {tax_name}?",
-                    f"Expliquez-moi la procédure pour {tax_name}",
-                    f"Comment faire pour obtenir {tax_name}?"
-                ]
-                
                 proc_answer = f"La procédure pour {tax_name} est la suivante: {tax['procedimiento']}"
                 
-                for question in proc_questions:
-                    qa_pairs.append({
-                        "question": question,
-                        "answer": proc_answer
-                    })
+                for format_question in PROC_QUESTIONS:
+                    add_qa(QAPair(
+                        question=format_question(tax_name),
+                        answer=proc_answer
+                    ))
             
             # Questions sur le ministère responsable
-            ministry_questions = [
-                f"Quel ministère est responsable de {tax_name}?",
-                f"Qui gère {tax_name}?",
-                f"Quel organisme s'occupe de {tax_name}?",
-                f"De quel ministère dépend {tax_name}?",
-                f"À quel ministère appartient {tax_name}?"
-            ]
-            
             ministry_answer = f"{tax_name} est géré par le {tax['ministerio_nombre']}, dans le secteur de {tax['sector_nombre']}."
             
-            for question in ministry_questions:
-                qa_pairs.append({
-                    "question": question,
-                    "answer": ministry_answer
-                })
+            for format_question in MINISTRY_QUESTIONS:
+                add_qa(QAPair(
+                    question=format_question(tax_name),
+                    answer=ministry_answer
+                ))
         
         return qa_pairs
     
@@ -235,42 +565,34 @@ class CorpusGenerator:
         """
         Génère des questions de recherche basées sur des mots-clés ou des thèmes.
         """
+        return _pairs_to_dicts(self._search_question_pairs())
+    
+    def _search_question_pairs(self) -> List[QAPair]:
+        """Paires de generate_search_questions, sous forme de QAPair."""
         qa_pairs = []
+        add_qa = qa_pairs.append
         
         # Regrouper les taxes par mots-clés
         keyword_to_taxes = {}
         for tax in self.tax_data:
-            keywords = tax.get('palabras_clave', '').split(',')
-            keywords = [k.strip().lower() for k in keywords if k.strip()]
-            
-            for keyword in keywords:
-                if keyword not in keyword_to_taxes:
-                    keyword_to_taxes[keyword] = []
-                keyword_to_taxes[keyword].append(tax)
+            # Chaque mot-clé n'est nettoyé qu'une seule fois
+            for keyword in tax.get('palabras_clave', '').split(','):
+                keyword = keyword.strip().lower()
+                if keyword:
+                    keyword_to_taxes.setdefault(keyword, []).append(tax)
         
         # Générer des questions par mot-clé (pour les mots-clés qui ont au moins 2 taxes)
         for keyword, taxes in keyword_to_taxes.items():
             if len(taxes) >= 2:
-                search_questions = [
-                    f"Quelles taxes concernent {keyword}?",
-                    f"Y a-t-il des taxes liées à {keyword}?",
-                    f"Parlez-moi des taxes sur {keyword}",
-                    f"Quels sont les frais liés à {keyword}?",
-                    f"Je cherche des informations sur les taxes de {keyword}"
-                ]
-                
-                tax_names = [tax['concepto_nombre'] for tax in taxes[:5]]
-                tax_list = ", ".join(tax_names)
-                if len(taxes) > 5:
-                    tax_list += f" et {len(taxes) - 5} autres"
+                tax_list = self._format_tax_list(taxes, "autres")
                 
                 search_answer = f"Pour {keyword}, il existe {len(taxes)} taxes associées, notamment: {tax_list}."
                 
-                for question in search_questions:
-                    qa_pairs.append({
-                        "question": question,
-                        "answer": search_answer
-                    })
+                for format_question in SEARCH_QUESTIONS:
+                    add_qa(QAPair(
+                        question=format_question(keyword),
+                        answer=search_answer
+                    ))
         
         return qa_pairs
     
@@ -279,67 +601,32 @@ class CorpusGenerator:
         Génère des questions plus naturelles et diverses, incluant des fautes 
         courantes, des reformulations et des questions partielles.
         """
+        return _pairs_to_dicts(self._synthetic_question_pairs())
+    
+    def _synthetic_question_pairs(self) -> List[QAPair]:
+        """Paires de generate_synthetic_questions, sous forme de QAPair."""
         qa_pairs = []
+        add_qa = qa_pairs.append
         
         # Échantillon de taxes pour les questions synthétiques (pour éviter de générer trop de données)
-        sample_taxes = random.sample(self.tax_data, min(50, len(self.tax_data)))
+        sample_taxes = self.rng.sample(self.tax_data, min(50, len(self.tax_data)))
         
         for tax in sample_taxes:
             tax_name = tax['concepto_nombre']
             
-            # Questions informelles ou mal orthographiées
-            informal_questions = [
-                f"c koi le prix de {tax_name}?",
-                f"combien ça coute {tax_name}",
-                f"je veu savoir le prix de {tax_name}",
-                f"tarif {tax_name} svp",
-                f"info sur {tax_name}"
-            ]
-            
             # Construire la réponse
-            cost_answer = f"Pour {tax_name}, "
-            has_expedicion = tax['tasa_expedicion'] and tax['tasa_expedicion'] != '0'
-            has_renovacion = tax['tasa_renovacion'] and tax['tasa_renovacion'] != '0'
-            
-            if has_expedicion and has_renovacion:
-                cost_answer += f"le coût d'expédition est de {tax['tasa_expedicion']} FCFA et le coût de renouvellement est de {tax['tasa_renovacion']} FCFA."
-            elif has_expedicion:
-                cost_answer += f"le coût est de {tax['tasa_expedicion']} FCFA."
-            elif has_renovacion:
-                cost_answer += f"le coût de renouvellement est de {tax['tasa_renovacion']} FCFA."
-            else:
-                cost_answer += "les informations de coût ne sont pas disponibles."
+            cost_answer = _cost_answer(tax_name, tax['tasa_expedicion'], tax['tasa_renovacion'])
             
             ministry_info = f"\nCette taxe est gérée par le {tax['ministerio_nombre']}."
             
-            for question in informal_questions:
-                qa_pairs.append({
-                    "question": question,
-                    "answer": cost_answer + ministry_info
-                })
+            for format_question in INFORMAL_QUESTIONS:
+                add_qa(QAPair(
+                    question=format_question(tax_name),
+                    answer=cost_answer + ministry_info
+                ))
         
         # Questions générales vagues ou ambiguës
-        vague_questions = [
-            "Comment obtenir un passeport?",
-            "Combien coûte une carte d'identité?",
-            "Documents pour visa",
-            "Prix du permis",
-            "Où payer les taxes?"
-        ]
-        
-        vague_answers = [
-            "Pour obtenir un passeport, vous devez vérifier les frais spécifiques et les documents requis. Pouvez-vous préciser quel type de passeport vous intéresse?",
-            "Le coût d'une carte d'identité dépend du type et du ministère concerné. Pouvez-vous préciser quelle carte d'identité vous intéresse?",
-            "Les documents requis pour un visa dépendent du type de visa. Pouvez-vous préciser quel visa vous intéresse?",
-            "Le prix du permis varie selon le type. Pouvez-vous préciser quel permis vous intéresse?",
-            "Les taxes peuvent être payées auprès du ministère concerné. Pour des informations plus précises, veuillez spécifier quelle taxe vous intéresse."
-        ]
-        
-        for i, question in enumerate(vague_questions):
-            qa_pairs.append({
-                "question": question,
-                "answer": vague_answers[i]
-            })
+        qa_pairs.extend(VAGUE_QUESTIONS)
         
         return qa_pairs
     
@@ -347,42 +634,11 @@ class CorpusGenerator:
         """
         Génère des questions d'ouverture de conversation et des questions de suivi.
         """
-        conversation_starters = [
-            {
-                "question": "Bonjour",
-                "answer": "Bonjour! Je suis l'assistant virtuel de TaxasGE. Je peux vous aider à trouver des informations sur les taxes fiscales en Guinée Équatoriale. Que souhaitez-vous savoir?"
-            },
-            {
-                "question": "Salut",
-                "answer": "Salut! Je suis là pour vous aider avec les informations sur les taxes fiscales. Comment puis-je vous aider aujourd'hui?"
-            },
-            {
-                "question": "Comment ça va?",
-                "answer": "Je vais bien, merci! Je suis prêt à vous aider avec les informations sur les taxes et services fiscaux. Quelle information recherchez-vous?"
-            },
-            {
-                "question": "Qui es-tu?",
-                "answer": "Je suis l'assistant virtuel de TaxasGE, conçu pour vous aider à trouver des informations sur les taxes fiscales en Guinée Équatoriale. Je peux vous renseigner sur les coûts, les documents requis et les procédures pour différentes taxes."
-            },
-            {
-                "question": "Comment t'utiliser?",
-                "answer": "C'est simple! Vous pouvez me poser des questions sur les taxes fiscales, comme 'Combien coûte un passeport?' ou 'Quels documents sont nécessaires pour un visa?'. Je ferai de mon mieux pour vous répondre avec les informations dont je dispose."
-            },
-            {
-                "question": "Que peux-tu faire?",
-                "answer": "Je peux vous fournir des informations sur les taxes fiscales en Guinée Équatoriale, notamment les coûts, les documents requis, les procédures, et les ministères responsables. N'hésitez pas à me poser des questions spécifiques sur la taxe qui vous intéresse."
-            },
-            {
-                "question": "Merci",
-                "answer": "Je vous en prie! N'hésitez pas à me poser d'autres questions si vous avez besoin de plus d'informations. Je suis là pour vous aider."
-            },
-            {
-                "question": "Au revoir",
-                "answer": "Au revoir! N'hésitez pas à revenir si vous avez d'autres questions sur les taxes fiscales. Bonne journée!"
-            }
-        ]
-        
-        return conversation_starters
+        return _pairs_to_dicts(self._conversation_starter_pairs())
+    
+    def _conversation_starter_pairs(self) -> List[QAPair]:
+        """Paires de generate_conversation_starters, sous forme de QAPair."""
+        return list(CONVERSATION_STARTERS)
         
     def translate_to_spanish(self, text):
         """
@@ -390,89 +646,7 @@ class CorpusGenerator:
         Cette fonction applique des règles simples de traduction, 
         ce qui est suffisant pour notre cas d'utilisation.
         """
-        # Dictionnaire de base français -> espagnol
-        fr_to_es = {
-            # Mots courants
-            "bonjour": "hola",
-            "salut": "hola",
-            "merci": "gracias",
-            "au revoir": "adiós",
-            "comment": "cómo",
-            "combien": "cuánto",
-            "coûte": "cuesta",
-            "prix": "precio",
-            "documents": "documentos",
-            "requis": "requeridos",
-            "nécessaires": "necesarios",
-            "procédure": "procedimiento",
-            "obtenir": "obtener",
-            "ministère": "ministerio",
-            "responsable": "responsable",
-            "taxe": "tasa",
-            "taxes": "tasas",
-            "fiscales": "fiscales",
-            "s'il vous plaît": "por favor",
-            "information": "información",
-            "je voudrais": "quisiera",
-            "besoin": "necesito",
-            "savoir": "saber",
-            "cherche": "busco",
-            "quels": "cuáles",
-            "quelles": "cuáles",
-            "est": "es",
-            "sont": "son",
-            "pour": "para",
-            "de": "de",
-            "du": "del",
-            "la": "la",
-            "le": "el",
-            "les": "los",
-            "un": "un",
-            "une": "una",
-            "des": "de los",
-            "et": "y",
-            "ou": "o",
-            "qui": "qué",
-            "quel": "cuál",
-            "quelle": "cuál",
-            
-            # Termes spécifiques aux taxes
-            "passeport": "pasaporte",
-            "visa": "visado",
-            "carte d'identité": "documento de identidad",
-            "permis": "permiso",
-            "expédition": "expedición",
-            "renouvellement": "renovación",
-            "montant": "cantidad",
-            "paiement": "pago",
-            "payer": "pagar",
-        }
-        
-        # Traitement simple: remplacer les mots
-        words = text.lower().split()
-        translated_words = []
-        
-        for word in words:
-            # Nettoyage pour la comparaison
-            clean_word = word.strip(".,;:!?")
-            
-            # Chercher la traduction
-            if clean_word in fr_to_es:
-                # Conserver la ponctuation si présente
-                if word != clean_word:
-                    punctuation = word[len(clean_word):]
-                    translated_words.append(fr_to_es[clean_word] + punctuation)
-                else:
-                    translated_words.append(fr_to_es[clean_word])
-            else:
-                translated_words.append(word)
-        
-        # Reconstruction avec la première lettre en majuscule
-        translated_text = " ".join(translated_words)
-        if translated_text:
-            translated_text = translated_text[0].upper() + translated_text[1:]
-        
-        return translated_text
+        return _translate(text, FR_TO_ES)
 
     def translate_to_english(self, text):
         """
@@ -480,91 +654,27 @@ class CorpusGenerator:
         Cette fonction applique des règles simples de traduction,
         ce qui est suffisant pour notre cas d'utilisation.
         """
-        # Dictionnaire de base français -> anglais
-        fr_to_en = {
-            # Mots courants
-            "bonjour": "hello",
-            "salut": "hi",
-            "merci": "thank you",
-            "au revoir": "goodbye",
-            "comment": "how",
-            "combien": "how much",
-            "coûte": "cost",
-            "prix": "price",
-            "documents": "documents",
-            "requis": "required",
-            "nécessaires": "necessary",
-            "procédure": "procedure",
-            "obtenir": "obtain",
-            "ministère": "ministry",
-            "responsable": "responsible",
-            "taxe": "tax",
-            "taxes": "taxes",
-            "fiscales": "fiscal",
-            "s'il vous plaît": "please",
-            "information": "information",
-            "je voudrais": "I would like",
-            "besoin": "need",
-            "savoir": "know",
-            "cherche": "looking for",
-            "quels": "which",
-            "quelles": "which",
-            "est": "is",
-            "sont": "are",
-            "pour": "for",
-            "de": "of",
-            "du": "of the",
-            "la": "the",
-            "le": "the",
-            "les": "the",
-            "un": "a",
-            "une": "a",
-            "des": "of the",
-            "et": "and",
-            "ou": "or",
-            "qui": "who",
-            "quel": "which",
-            "quelle": "which",
-            
-            # Termes spécifiques aux taxes
-            "passeport": "passport",
-            "visa": "visa",
-            "carte d'identité": "identity card",
-            "permis": "permit",
-            "expédition": "issuance",
-            "renouvellement": "renewal",
-            "montant": "amount",
-            "paiement": "payment",
-            "payer": "pay",
-        }
-        
-        # Traitement simple: remplacer les mots
-        words = text.lower().split()
-        translated_words = []
+        return _translate(text, FR_TO_EN)
+
+    def _translate_texts(self, texts: List[str], dictionary: Dict[str, str], executor=None, workers: int = 1) -> List[str]:
+        """
+        Traduit une liste de textes, en répartissant le travail sur un pool de
+        processus si `executor` est fourni.
         
-        for word in words:
-            # Nettoyage pour la comparaison
-            clean_word = word.strip(".,;:!?")
-            
-            # Chercher la traduction
-            if clean_word in fr_to_en:
-                # Conserver la ponctuation si présente
-                if word != clean_word:
-                    punctuation = word[len(clean_word):]
-                    translated_words.append(fr_to_en[clean_word] + punctuation)
-                else:
-                    translated_words.append(fr_to_en[clean_word])
-            else:
-                translated_words.append(word)
-        
-        # Reconstruction avec la première lettre en majuscule
-        translated_text = " ".join(translated_words)
-        if translated_text:
-            translated_text = translated_text[0].upper() + translated_text[1:]
-        
-        return translated_text
-
-    def generate_multilingual_corpus(self, output_file, augmentation_factor=1, include_spanish=True, include_english=True):
+        Chaque texte distinct n'est traduit qu'une fois et toutes ses occurrences
+        partagent la même chaîne traduite: une réponse est en effet répétée pour
+        chacune de ses questions et de leurs variantes augmentées.
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        if executor is None:
+            translated = [_translate(text, dictionary) for text in unique_texts]
+        else:
+            chunksize = max(1, len(unique_texts) // (workers * 4))
+            translated = executor.map(partial(_translate, dictionary=dictionary), unique_texts, chunksize=chunksize)
+        translations = dict(zip(unique_texts, translated))
+        return [translations[text] for text in texts]
+
+    def generate_multilingual_corpus(self, output_file, augmentation_factor=1, include_spanish=True, include_english=True, workers=1):
         """
         Génère le corpus complet multilingue et le sauvegarde dans un fichier JSON.
         
@@ -573,104 +683,140 @@ class CorpusGenerator:
             augmentation_factor: Facteur de multiplication pour l'augmentation des données
             include_spanish: Inclure les traductions en espagnol
             include_english: Inclure les traductions en anglais
+            workers: Nombre de processus utilisés pour les traductions (1 = séquentiel)
         """
-        # Générer différents types de questions-réponses
-        general_qa = self.generate_general_questions()
-        specific_qa = self.generate_specific_tax_questions()
-        search_qa = self.generate_search_questions()
-        synthetic_qa = self.generate_synthetic_questions()
-        conversation_qa = self.generate_conversation_starters()
-        
-        # Combiner tous les types de QA
-        all_qa = general_qa + specific_qa + search_qa + synthetic_qa + conversation_qa
+        # Générer différents types de questions-réponses dans une seule liste,
+        # sans les listes intermédiaires d'une concaténation
+        all_qa = []
+        add_qa = all_qa.extend
+        add_qa(self._general_question_pairs())
+        add_qa(self._specific_tax_question_pairs())
+        add_qa(self._search_question_pairs())
+        add_qa(self._synthetic_question_pairs())
+        add_qa(self._conversation_starter_pairs())
+        
+        # Combiner tous les types de QA en colonnes parallèles: les dictionnaires
+        # ne sont construits qu'une fois, au moment d'assembler le corpus final
+        questions = [qa.question for qa in all_qa]
+        answers = [qa.answer for qa in all_qa]
         
         # Augmentation des données: légères variations des questions (si facteur > 1)
-        augmented_qa = []
+        # Les variantes identiques à une paire déjà présente (aucune modification
+        # tirée, ou même variante tirée deux fois) sont écartées
+        augmented_questions = []
+        augmented_answers = []
+        seen_pairs = set(zip(questions, answers))
+        # Fonctions aléatoires liées localement: elles sont appelées plusieurs fois par paire
+        rand = self.rng.random
+        randrange = self.rng.randrange
+        choice = self.rng.choice
         for _ in range(augmentation_factor - 1):
-            for qa in all_qa:
-                if 'question' in qa and 'answer' in qa:
-                    # Créer une légère variation de la question
-                    question = qa['question']
-                    words = question.split()
-                    
-                    # Aléatoirement ajouter/supprimer/modifier quelques mots
-                    if len(words) > 3 and random.random() > 0.5:
-                        # Supprimer un mot aléatoire
-                        idx = random.randint(0, len(words) - 1)
-                        words.pop(idx)
-                    
-                    # Ajouter des préfixes aléatoires
-                    prefixes = ["Dites-moi ", "Je voudrais savoir ", "Pourriez-vous me dire ", "J'aimerais connaître "]
-                    if random.random() > 0.7:
-                        words = [random.choice(prefixes)] + words
-                    
-                    # Ajouter des suffixes aléatoires
-                    suffixes = [" s'il vous plaît", " merci", " si possible", " rapidement"]
-                    if random.random() > 0.7:
-                        words.append(random.choice(suffixes))
-                    
-                    new_question = " ".join(words)
-                    augmented_qa.append({
-                        "question": new_question,
-                        "answer": qa['answer']
-                    })
-        
-        # Ajouter les questions augmentées
-        all_qa.extend(augmented_qa)
-        
-        # Ajouter les traductions en espagnol
-        if include_spanish:
-            spanish_qa = []
-            for qa in all_qa:
-                if 'question' in qa and 'answer' in qa:
-                    spanish_qa.append({
-                        "question": self.translate_to_spanish(qa['question']),
-                        "answer": self.translate_to_spanish(qa['answer']),
-                        "language": "es"
-                    })
-            all_qa.extend(spanish_qa)
-            print(f"Ajout de {len(spanish_qa)} paires question-réponse en espagnol")
-        
-        # Ajouter les traductions en anglais
-        if include_english:
-            english_qa = []
-            for qa in all_qa:
-                if 'question' in qa and 'answer' in qa and not qa.get('language'):  # Ne traduire que les originaux français
-                    english_qa.append({
-                        "question": self.translate_to_english(qa['question']),
-                        "answer": self.translate_to_english(qa['answer']),
-                        "language": "en"
-                    })
-            all_qa.extend(english_qa)
-            print(f"Ajout de {len(english_qa)} paires question-réponse en anglais")
-        
-        # Marquer les originaux comme français
-        for qa in all_qa:
-            if 'question' in qa and 'answer' in qa and not qa.get('language'):
-                qa['language'] = 'fr'
-        
-        # Mélanger les QA pour une meilleure distribution lors de l'entraînement
-        random.shuffle(all_qa)
-        
-        # Créer le corpus final avec des métadonnées
-        corpus = {
-            "metadata": {
-                "version": "1.0",
-                "created_at": "2025-04-14",
-                "size": len(all_qa),
-                "languages": ["fr"] + (["es"] if include_spanish else []) + (["en"] if include_english else []),
-                "description": "Corpus d'entraînement multilingue pour le modèle NLP de l'application TaxasGE"
-            },
-            "data": all_qa
+            for question, answer in zip(questions, answers):
+                # Créer une légère variation de la question
+                words = question.split()
+                
+                # Aléatoirement ajouter/supprimer/modifier quelques mots
+                if len(words) > 3 and rand() > 0.5:
+                    # Supprimer un mot aléatoire
+                    words.pop(randrange(len(words)))
+                
+                # Ajouter des préfixes aléatoires
+                if rand() > 0.7:
+                    words.insert(0, choice(AUGMENTATION_PREFIXES))
+                
+                # Ajouter des suffixes aléatoires
+                if rand() > 0.7:
+                    words.append(choice(AUGMENTATION_SUFFIXES))
+                
+                augmented_pair = (" ".join(words), answer)
+                if augmented_pair in seen_pairs:
+                    continue
+                seen_pairs.add(augmented_pair)
+                augmented_questions.append(augmented_pair[0])
+                augmented_answers.append(answer)
+        
+        # Ajouter les paires augmentées; toutes les paires sont alors en français
+        questions.extend(augmented_questions)
+        answers.extend(augmented_answers)
+        french_count = len(questions)
+        languages = ['fr'] * french_count
+        
+        # Les traductions sont indépendantes les unes des autres: elles peuvent
+        # être réparties sur plusieurs processus
+        french_texts = questions + answers
+        with ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext() as executor:
+            # Ajouter les traductions en espagnol
+            if include_spanish:
+                translated = self._translate_texts(french_texts, FR_TO_ES, executor, workers)
+                questions.extend(translated[:french_count])
+                answers.extend(translated[french_count:])
+                languages.extend(['es'] * french_count)
+                print(f"Ajout de {french_count} paires question-réponse en espagnol")
+            
+            # Ajouter les traductions en anglais (uniquement à partir des originaux français)
+            if include_english:
+                translated = self._translate_texts(french_texts, FR_TO_EN, executor, workers)
+                questions.extend(translated[:french_count])
+                answers.extend(translated[french_count:])
+                languages.extend(['en'] * french_count)
+                print(f"Ajout de {french_count} paires question-réponse en anglais")
+        
+        # Mélanger les QA pour une meilleure distribution lors de l'entraînement;
+        # les lignes restent des tuples, les dictionnaires ne sont créés qu'à l'écriture
+        all_qa = list(zip(questions, answers, languages))
+        self.rng.shuffle(all_qa)
+        
+        # Métadonnées du corpus final
+        metadata = {
+            "version": "1.0",
+            "created_at": "2025-04-14",
+            "size": len(all_qa),
+            "languages": ["fr"] + (["es"] if include_spanish else []) + (["en"] if include_english else []),
+            "description": "Corpus d'entraînement multilingue pour le modèle NLP de l'application TaxasGE"
         }
         
         # Sauvegarder le corpus
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(corpus, f, ensure_ascii=False, indent=2)
+        self.save_corpus(output_file, metadata, (
+            {"question": question, "answer": answer, "language": language}
+            for question, answer, language in all_qa
+        ))
         
         print(f"Corpus multilingue généré avec succès: {len(all_qa)} paires question-réponse sauvegardées dans {output_file}")
 
+    def save_corpus(self, output_file: str, metadata: Dict[str, Any], qa_pairs: Iterable[Dict[str, str]]) -> None:
+        """
+        Sauvegarde le corpus dans un fichier JSON, une paire question-réponse par ligne.
+        
+        Chaque paire est encodée séparément (orjson s'il est installé), ce qui
+        évite l'encodeur Python pur utilisé par json.dump avec indentation. Les
+        paires sont consommées par lots de WRITE_BATCH_SIZE, assemblés et écrits
+        en une seule fois: `qa_pairs` peut donc être un générateur, et seul un
+        lot encodé à la fois est gardé en mémoire.
+        
+        Args:
+            output_file: Chemin du fichier de sortie
+            metadata: Métadonnées du corpus
+            qa_pairs: Paires question-réponse à sauvegarder (liste ou générateur)
+        """
+        # Un chemin sans répertoire désigne le répertoire courant: rien à créer
+        output_dir = os.path.dirname(output_file)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        with open(output_file, 'wb') as f:
+            f.write(b'{"metadata": ')
+            f.write(_json_dumps(metadata))
+            f.write(b', "data": [')
+            qa_pairs = iter(qa_pairs)
+            separator = b"\n"
+            while True:
+                batch = list(islice(qa_pairs, WRITE_BATCH_SIZE))
+                if not batch:
+                    break
+                f.write(separator)
+                f.write(b",\n".join(map(_json_dumps, batch)))
+                separator = b",\n"
+            f.write(b"\n]}\n")
+
 def main():
     # Parser d'arguments en ligne de commande
     parser = argparse.ArgumentParser(description="Génère un corpus d'entraînement pour le modèle NLP de TaxasGE")
@@ -680,6 +826,8 @@ def main():
     parser.add_argument("--spanish", "-s", action="store_true", help="Inclure les traductions en espagnol")
     parser.add_argument("--english", "-e", action="store_true", help="Inclure les traductions en anglais")
     parser.add_argument("--all-languages", "-l", action="store_true", help="Inclure toutes les langues (espagnol et anglais)")
+    parser.add_argument("--seed", type=int, default=None, help="Graine aléatoire pour générer un corpus reproductible")
+    parser.add_argument("--workers", "-w", type=int, default=1, help="Nombre de processus pour les traductions (1 = séquentiel)")
     
     args = parser.parse_args()
     
@@ -698,5 +846,5 @@ def main():
         include_english = True
     
     # Générer le corpus
-    generator = CorpusGenerator(args.input)
-    generator.generate_multilingual_corpus(args.output, args.augmentation, include_spanish, include_english)
+    generator = CorpusGenerator(args.input, args.seed)
+    generator.generate_multilingual_corpus(args.output, args.augmentation, include_spanish, include_english, args.workers)